@@ -1,9 +1,17 @@
 # SPDX-FileCopyrightText: 2024-present Hedwyn <bpestourie@gmail.com>
 #
 # SPDX-License-Identifier: MIT
-from ._results import Result, Ok, Err, NoneOr, AbstractResult
+from ._results import Result, Ok, Err, NoneOr, AbstractResult, is_ok, is_err
 from ._errors import Error
-from ._iterators import resultify, result_mapper, result_reducer, chain_results
+from ._iterators import (
+    resultify,
+    resultify_list,
+    result_mapper,
+    result_map_reduce,
+    result_reducer,
+    result_collect,
+    chain_results,
+)
 from ._builtin import (
     safe_int_divide,
     safe_divide,
@@ -20,10 +28,15 @@ __all__ = [
     "Ok",
     "Err",
     "NoneOr",
+    "is_ok",
+    "is_err",
     "Error",
     "resultify",
+    "resultify_list",
     "result_mapper",
+    "result_map_reduce",
     "result_reducer",
+    "result_collect",
     "chain_results",
     "safe_int_divide",
     "safe_divide",
@@ -96,7 +96,7 @@ def safe_getattr(
     """
 
     found = getattr(obj, attr, default)
-    if found != _NO_DEFAULT:
+    if found is not _NO_DEFAULT:
         return Ok(found)
     return Err(BadAttribute(obj, attr))
 
@@ -114,10 +114,18 @@ def safe_getitem(
         The attribute value if it exists.
         AttributeErr Otherwise.
     """
-    # Note: using contextlib.suppress is more elegant but slower
-    try:
-        return Ok(obj[key])
-    except KeyError:
-        if default != _NO_DEFAULT:
-            return Ok(default)
-        return Err(BadKey(obj, key))
+    # Plain dicts: dict.get avoids raising and catching KeyError on misses.
+    # Subclasses go through [] as they may define __missing__ (e.g. defaultdict)
+    if type(obj) is dict:
+        found = obj.get(key, _NO_DEFAULT)
+        if found is not _NO_DEFAULT:
+            return Ok(found)
+    else:
+        # Note: using contextlib.suppress is more elegant but slower
+        try:
+            return Ok(obj[key])
+        except KeyError:
+            pass
+    if default is not _NO_DEFAULT:
+        return Ok(default)
+    return Err(BadKey(obj, key))
@@ -9,10 +9,11 @@ from __future__ import annotations
 from typing import (
     NoReturn,
     Any,
+    Callable,
     ClassVar,
+    Mapping,
 )
-from functools import cached_property
-from dataclasses import is_dataclass, dataclass, field, asdict
+from dataclasses import dataclass, field, fields
 
 
 @dataclass
@@ -39,19 +40,61 @@ class Error:
 
     description: ClassVar[str | None] = None
     exception_cls: ClassVar[type[Exception]] = Exception
-    _notes: list[str] = field(
-        init=False, compare=False, hash=False, default_factory=list
-    )
+    _public_field_names: ClassVar[tuple[str, ...]]
+    _format: ClassVar[Callable[[Mapping[str, Any]], str] | None] = None
+    # Description `_format` was bound from, to rebind it if `description` is reassigned
+    _format_source: ClassVar[str | None] = None
+    # Note: defaulting to a shared empty tuple rather than a list factory
+    # keeps the generated __init__ free of any per-instance allocation
+    _notes: tuple[str, ...] = field(init=False, compare=False, hash=False, default=())
 
-    @cached_property
-    def _is_dataclass(self) -> bool:
+    def __init_subclass__(cls, **kwargs: Any) -> None:
         """
+        Binds the description formatter once per class.
+        """
+        super().__init_subclass__(**kwargs)
+        cls._bind_format()
+
+    @classmethod
+    def _bind_format(cls) -> Callable[[Mapping[str, Any]], str] | None:
+        """
+        Binds the formatter for the current description of this class.
+        Constant descriptions get no formatter, so that `__str__`
+        can return them as-is.
+
+        Returns
+        -------
+        Callable[[Mapping[str, Any]], str] | None
+            The bound formatter, None for constant descriptions.
+        """
+        description = cls.description
+        # Note: checking braces rather than fields,
+        # so that escaped `{{`/`}}` still get unescaped
+        if description is not None and ("{" in description or "}" in description):
+            cls._format = description.format_map
+        else:
+            cls._format = None
+        cls._format_source = description
+        return cls._format
+
+    @classmethod
+    def _public_fields(cls) -> tuple[str, ...]:
+        """
+        Field names are fixed once the class has been decorated,
+        so they are computed on first use and cached on the class itself.
+        Note: this cannot be done in `__init_subclass__`, which runs
+        before `@dataclass` has collected the fields.
+
         Returns
         -------
-        bool
-            Whether this object is a dataclass
+        tuple[str, ...]
+            Names of the public (not starting with '_') fields of this error class
         """
-        return is_dataclass(self)
+        names: tuple[str, ...] | None = cls.__dict__.get("_public_field_names")
+        if names is None:
+            names = tuple(f.name for f in fields(cls) if f.name[0] != "_")
+            cls._public_field_names = names
+        return names
 
     @property
     def args(self) -> dict[str, Any]:
@@ -61,13 +104,14 @@ class Error:
         dict[str, Any]
             Dict containing the arguments and their current values
         """
-        return {name: value for name, value in asdict(self).items() if name[0] != "_"}
+        # Note: asdict() is avoided on purpose, it deep-copies every field
+        return {name: getattr(self, name) for name in self._public_fields()}
 
     def add_notes(self, *notes: str) -> None:
         """
         Adds a note to give more details on this error object.
         """
-        self._notes.extend(notes)
+        self._notes += notes
 
     def __str__(self) -> str:
         """
@@ -76,18 +120,24 @@ class Error:
         str
             The complete error description
         """
-        if self.description is None:
-            return ""
-        return self.description.format(**self.args)
+        cls = type(self)
+        description = cls.description
+        formatter = cls._format
+        if description is not cls._format_source:
+            formatter = cls._bind_format()
+        if formatter is None:
+            return description or ""
+        return formatter(self.args)
 
     def throw(self) -> NoReturn:
         """
         Raises an exception from this error.
         Uses the exception class `exception_cls` defined at the class-level.
         """
-        exc = self.exception_cls(self.description)
-        for note in self._notes:
-            exc.add_note(note)
+        exc = self.exception_cls(str(self))
+        if self._notes:
+            # Note: single assignment rather than one add_note() call per note
+            exc.__notes__ = list(self._notes)
         raise exc
 
 @dataclass
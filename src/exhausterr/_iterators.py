@@ -9,16 +9,18 @@ from __future__ import annotations
 from typing import (
     Iterable,
     cast,
-    assert_never,
     overload,
     Iterator,
     TypeVar,
     Callable,
     Any,
-    reveal_type,
+    Self,
+    Final,
 )
+from functools import lru_cache
+from operator import length_hint
 
-from ._results import Ok, Result, Err, NoneOr
+from ._results import Ok, Err, Result, NoneOr
 from ._errors import Error
 
 R = TypeVar("R")
@@ -31,6 +33,34 @@ _D = TypeVar("_D")
 _E = TypeVar("_E")
 T = TypeVar("T")
 
+# Maximum number of values cached per function by `result_mapper(..., memoize=True)`
+_MEMOIZE_MAXSIZE: Final = 1024
+
+
+class _SizedMap(map):
+    """
+    A `map` forwarding the length hint of the mapped collection,
+    so that e.g. `list(result_mapper(...))` can preallocate its storage.
+    Iteration itself stays the C implementation of `map`.
+    """
+
+    _iterator: Iterator[Any]
+
+    def __new__(cls, func: Callable[[_A], _B], collection: Iterable[_A]) -> Self:
+        iterator = iter(collection)
+        self = super().__new__(cls, func, iterator)
+        self._iterator = iterator
+        return self
+
+    def __length_hint__(self) -> int:
+        """
+        Returns
+        -------
+        int
+            Estimated number of remaining items, 0 if unknown.
+        """
+        return length_hint(self._iterator)
+
 
 def resultify(values: Iterable[R]) -> Iterator[Ok[R]]:
     """
@@ -39,9 +69,76 @@ def resultify(values: Iterable[R]) -> Iterator[Ok[R]]:
     return map(Ok, values)
 
 
+def resultify_list(values: Iterable[R]) -> list[Ok[R]]:
+    """
+    Eager variant of `resultify`, for consumers that will
+    iterate the results right away (e.g., `result_reducer(*results)`).
+    """
+    return list(map(Ok, values))
+
+
+def _memoize(
+    func: Callable[[Any], Result[Any, Error]],
+) -> Callable[[Any], Result[Any, Error]]:
+    """
+    Caches the results of `func` per input value.
+    Unhashable values are passed to `func` directly, uncached.
+    """
+    cached = lru_cache(maxsize=_MEMOIZE_MAXSIZE, typed=True)(func)
+
+    def memoized(value: Any) -> Result[Any, Error]:
+        try:
+            hash(value)
+        except TypeError:
+            return func(value)
+        return cached(value)
+
+    return memoized
+
+
+def _compose(
+    funcs: tuple[Callable[[Any], Result[Any, Error]], ...],
+) -> Callable[[Any], Result[Any, Error]]:
+    """
+    Builds the composition of `funcs` once, so that mapping a collection
+    only costs one call per item on top of the functions themselves.
+    The composed function stops on the first Err and returns it as-is.
+    """
+    first, rest = funcs[0], funcs[1:]
+    if not rest:
+        return first
+
+    def composed(value: Any) -> Result[Any, Error]:
+        result = first(value)
+        for func in rest:
+            # Note: plain attribute checks are cheaper than `match` class patterns
+            # in this loop, which runs once per item and per function
+            if result.error is not None:
+                break
+            result = func(result.value)
+        return result
+
+    return composed
+
+
+@overload
+def result_mapper(
+    collection: Iterable[_A],
+    /,
+    *,
+    stop_on_error: bool = False,
+    memoize: bool = False,
+) -> Iterable[Ok[_A]]: ...
+
+
 @overload
 def result_mapper(
-    collection: Iterable[_A], func1: Callable[[_A], Result[_B, Error]], /
+    collection: Iterable[_A],
+    func1: Callable[[_A], Result[_B, Error]],
+    /,
+    *,
+    stop_on_error: bool = False,
+    memoize: bool = False,
 ) -> Iterable[Result[_B, Error]]: ...
 
 
@@ -51,6 +148,9 @@ def result_mapper(
     func1: Callable[[_A], Result[_B, Error]],
     func2: Callable[[_B], Result[_C, Error]],
     /,
+    *,
+    stop_on_error: bool = False,
+    memoize: bool = False,
 ) -> Iterable[Result[_C, Error]]: ...
 
 
@@ -61,6 +161,9 @@ def result_mapper(
     func2: Callable[[_B], Result[_C, Error]],
     func3: Callable[[_C], Result[_D, Error]],
     /,
+    *,
+    stop_on_error: bool = False,
+    memoize: bool = False,
 ) -> Iterable[Result[_D, Error]]: ...
 
 
@@ -72,11 +175,17 @@ def result_mapper(
     func3: Callable[[_C], Result[_D, Error]],
     func4: Callable[[_D], Result[_E, Error]],
     /,
+    *,
+    stop_on_error: bool = False,
+    memoize: bool = False,
 ) -> Iterable[Result[_E, Error]]: ...
 
 
 def result_mapper(
-    collection: Iterable[Any], *funcs: Callable[[Any], Result[Any, Error]]
+    collection: Iterable[Any],
+    *funcs: Callable[[Any], Result[Any, Error]],
+    stop_on_error: bool = False,
+    memoize: bool = False,
 ) -> Iterable[Result[Any, Error]]:
     """
     Composes functions together and used the composed function to map values from a collection.
@@ -96,29 +205,87 @@ def result_mapper(
 
     funcs: Iterable[Callable[[A], Result[B, Error]]]
         Functions to compose together
+
+    stop_on_error: bool
+        If set, stops mapping after the first Err is yielded,
+        leaving the rest of `collection` unprocessed.
+
+    memoize: bool
+        If set, caches the result of each function per input value
+        (up to 1024 values per function) for the duration of this mapping.
+        Only meant for pure functions; repeated inputs then share the same
+        result objects. Unhashable values, including intermediate ones,
+        are passed through uncached.
+        Equal values of different types (e.g., 1, 1.0 and True) are cached separately.
+    """
+    if not funcs:
+        return _SizedMap(Ok, collection)
+    if memoize:
+        funcs = tuple(map(_memoize, funcs))
+    mapped = _SizedMap(_compose(funcs), collection)
+    if stop_on_error:
+        return _until_first_err(mapped)
+    return mapped
+
+
+def result_map_reduce(
+    collection: Iterable[Any],
+    *funcs: Callable[[Any], Result[Any, Error]],
+    reducer: Callable[[T, Any], T],
+    initializer: T,
+) -> Result[T, Error]:
     """
+    Single-pass equivalent of `result_reducer(*result_mapper(collection, *funcs), ...)`.
+    Maps every value of `collection` through the composition of `funcs`
+    and reduces the results as they come, stopping on the first error encountered.
+    Values after that error are never mapped.
+
+    Examples
+    --------
+    >>> result_map_reduce(
+        [1, 2, 4],
+        invert,
+        initializer=0,
+        reducer=operator.add,
+    )
+    Ok(1.75)
+
+    See also
+    --------
+    result_mapper, result_reducer
+    """
+    reduced_value = initializer
+    if not funcs:
+        for item in collection:
+            reduced_value = reducer(reduced_value, item)
+        return Ok(reduced_value)
+
+    composed = _compose(funcs)
     for item in collection:
-        _result: Result[Any, Error] = Ok(item)
-        _error: Error | None = None
-        for func in funcs:
-            match _result:
-                case Ok(value):
-                    _result = func(value)
-                case Err(error):
-                    _error = error
-                    break
-
-        if _error is not None:
-            yield Err(_error)
-        else:
-            yield _result
+        result = composed(item)
+        if result.error is not None:
+            return cast(Err[Error], result)
+        reduced_value = reducer(reduced_value, result.value)
+    return Ok(reduced_value)
+
+
+def _until_first_err(
+    results: Iterable[Result[Any, Error]],
+) -> Iterator[Result[Any, Error]]:
+    """
+    Yields `results` up to and including the first Err.
+    """
+    for result in results:
+        yield result
+        if result.error is not None:
+            return
 
 
 @overload
 def result_reducer(
     *results: Result[Any, Error],
-    reducer: None,
-    initializer: None,
+    reducer: None = None,
+    initializer: None = None,
 ) -> NoneOr[Error]: ...
 
 
@@ -144,15 +311,13 @@ def result_reducer(
     reduce(Seq[n + 1]) = reduce(reduce(Seq[0..n]), Seq[n + 1])
     with value for the first call being `initializer`.
 
+    Note that reducers building a new container on every call,
+    such as `lambda acc, value: acc + [value]`, make the reduction quadratic.
+    To gather the values into a list, use `result_collect` instead,
+    which appends in place.
+
     Examples
     --------
-    >>> result_reducer(
-        [Ok(2), Ok(3), Ok(5)],
-        initializer=[],
-        reducer=list.append
-    )
-    Ok([2,3,5])
-
     >>> result_reducer(
         [Ok(2), Ok(3), Ok(4)],
         initializer=0,
@@ -166,27 +331,62 @@ def result_reducer(
         reducer=sum
     )
     Err(3)
+
+    See also
+    --------
+    result_collect
     """
     reduced_value = cast(T, initializer)
-    for r in results:
-        match r:
-            case Ok(val):
-                if reducer is not None:
-                    reduced_value = reducer(reduced_value, val)
-            case Err(error):
-                return Err(error)
-
-            case _ as unreachable:
-                assert_never(unreachable)
+    # Note: picking the loop once rather than checking `reducer` on every item
+    if reducer is None:
+        for r in results:
+            if r.error is not None:
+                return r
+    else:
+        for r in results:
+            if r.error is not None:
+                return r
+            reduced_value = reducer(reduced_value, r.value)
 
     return Ok(reduced_value)
 
 
+def result_collect(
+    *results: Result[T, Error], into: Iterable[T] = ()
+) -> Result[list[T], Error]:
+    """
+    Collects the values wrapped by `results` into a list,
+    stopping on the first error encountered and returning it.
+    Equivalent to `result_reducer` with a list-appending reducer,
+    but appends in place instead of copying the list on every item.
+
+    Parameters
+    ----------
+    results: Result[T, Error]
+        The results to collect.
+
+    into: Iterable[T]
+        Values to start the list with, copied before collecting.
+
+    Examples
+    --------
+    >>> result_collect(Ok(2), Ok(3), Ok(5), into=[1])
+    Ok([1, 2, 3, 5])
+    """
+    collected = list(into)
+    append = collected.append
+    for r in results:
+        if r.error is not None:
+            return cast(Err[Error], r)
+        append(r.value)
+    return Ok(collected)
+
+
 @overload
 def chain_results(
     *funcs: Callable[[], Result[Any, Error]],
-    initializer: None,
-    reducer: None,
+    initializer: None = None,
+    reducer: None = None,
 ) -> NoneOr[Error]: ...
 
 
@@ -216,16 +416,16 @@ def chain_results(
     result_reducer
     """
     reduced_value = cast(T, initializer)
-    for f in funcs:
-        res = f()
-        match res:
-            case Ok(val):
-                if reducer:
-                    reduced_value = reducer(reduced_value, val)
-            case Err(error):
-                return Err(error)
-
-            case _ as unreachable:
-                assert_never(unreachable)
+    if reducer is None:
+        for f in funcs:
+            res = f()
+            if res.error is not None:
+                return res
+    else:
+        for f in funcs:
+            res = f()
+            if res.error is not None:
+                return res
+            reduced_value = reducer(reduced_value, res.value)
 
     return Ok(reduced_value)
@@ -31,6 +31,7 @@ which is equivalent to `Result[None, YourErrorType]`.
 """
 
 from __future__ import annotations
+import copyreg
 from typing import (
     Generic,
     TypeVar,
@@ -39,13 +40,14 @@ from typing import (
     Final,
     Literal,
     overload,
+    final,
+    Any,
     NoReturn,
+    TypeGuard,
 )
 from ._errors import Error, AnonymousError
 from enum import Enum, auto
 
-V = TypeVar("V")
-
 
 # -- Type Variables --- #
 R = TypeVar("R")
@@ -82,6 +84,8 @@ class AbstractResult(Generic[R, MaybeE]):
     rather than AbstractResult.
     """
 
+    # Note: keeping __weakref__ so that results can still be weakly referenced
+    __slots__ = ("value", "error", "__weakref__")
     __match_args__ = ("value", "error")
 
     @overload
@@ -108,6 +112,14 @@ class AbstractResult(Generic[R, MaybeE]):
         self.value = value
         self.error = error
 
+    def __reduce__(self) -> tuple[Any, ...]:
+        """
+        Same reduction as `object.__reduce_ex__(2)`, for every pickle protocol.
+        Note: protocols 0 and 1 reject slotted classes without a custom reduction.
+        """
+        newobj = copyreg.__newobj__  # type: ignore[attr-defined]
+        return (newobj, (type(self),), self.__getstate__())
+
     def __bool__(self) -> bool:
         """
         Returns
@@ -134,7 +146,7 @@ class AbstractResult(Generic[R, MaybeE]):
             # For Python3.13+ this should be accepted without ignore comment
             error.throw()
         value = self.value
-        if value == _NOTSET:
+        if value is _NOTSET:
             raise RuntimeError(
                 "This result object is empty and has never been set."
                 "You should not call AbstractResult directly"
@@ -142,16 +154,36 @@ class AbstractResult(Generic[R, MaybeE]):
         return value
 
 
+@final
 class Ok(AbstractResult[R, None], Generic[R]):
     """
     A successful result.
 
     """
 
+    __slots__ = ()
     __match_args__ = ("value",)
     error: None
     value: R
 
+    def __new__(cls, value: object = None) -> Ok[R]:
+        """
+        `Ok(None)` is by far the most common success result (see `NoneOr`),
+        so it is served from a shared instance rather than allocated on each call.
+        Shared instances should not have their `value` reassigned.
+        Same goes for `Ok(True)` and `Ok(False)`.
+        """
+        if cls is Ok and (value is None or value is True or value is False):
+            return _OK_CONSTANTS[value]
+        return super().__new__(cls)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        """
+        Note: `object.__reduce_ex__` would call `Ok.__new__` without the value,
+        getting the shared `Ok(None)` and writing the copied state onto it.
+        """
+        return (type(self), (self.value,))
+
     @overload
     def __init__(self: Ok[None]) -> None: ...
 
@@ -165,7 +197,9 @@ class Ok(AbstractResult[R, None], Generic[R]):
         value: R
             The returned value
         """
-        super().__init__(value, None)  # type: ignore[arg-type]
+        # Note: assigning slots directly rather than going through super().__init__
+        self.value = value  # type: ignore[assignment]
+        self.error = None
 
     def __bool__(self) -> Literal[True]:
         """
@@ -182,6 +216,11 @@ class Ok(AbstractResult[R, None], Generic[R]):
         Makes the comparison of two `Ok` objects equivalent to
         compare their wrapped values.
         """
+        if self is other:
+            return True
+        # Note: exact type check first, cheaper than isinstance for the common case
+        if type(other) is Ok:
+            return self.value == other.value
         if not isinstance(other, AbstractResult):
             return NotImplemented
         return other.error is None and self.value == other.value
@@ -217,11 +256,21 @@ class Ok(AbstractResult[R, None], Generic[R]):
         return self.value
 
 
+# Shared instances returned by `Ok()`, `Ok(None)`, `Ok(True)` and `Ok(False)`
+_OK_CONSTANTS: Final[dict[object, Ok[Any]]] = {}
+for _constant in (None, True, False):
+    _OK_CONSTANTS[_constant] = _ok = object.__new__(Ok)
+    Ok.__init__(_ok, _constant)
+del _constant, _ok
+
+
+@final
 class Err(AbstractResult[NotsetT, E], Generic[E]):
     """
     An error result.
     """
 
+    __slots__ = ()
     __match_args__ = ("error",)
 
     result: NotsetT
@@ -234,19 +283,34 @@ class Err(AbstractResult[NotsetT, E], Generic[E]):
         value: R
             The returned error
         """
-        if error is None:
-            error = Error()
-        elif isinstance(error, type) and issubclass(error, Error):
-            error = error()
-        elif not isinstance(error, Error):
-            error = AnonymousError(error)
-        super().__init__(_NOTSET, error)
+        # Note: error instances are by far the most common argument,
+        # so they are checked first and skip the conversions below
+        if not isinstance(error, Error):
+            if error is None:
+                error = Error()
+            elif isinstance(error, type) and issubclass(error, Error):
+                error = error()
+            else:
+                error = AnonymousError(error)
+        self.value = _NOTSET
+        self.error = error  # type: ignore[assignment]
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        """
+        Rebuilds the error result through its constructor when copied or pickled.
+        """
+        return (type(self), (self.error,))
 
     def __eq__(self, other: object) -> bool:
         """
         Makes the comparison of two `Err` objects equivalent to
         compare their wrapped values.
         """
+        if self is other:
+            return True
+        # Note: exact type check first, cheaper than isinstance for the common case
+        if type(other) is Err:
+            return self.error == other.error
         if not isinstance(other, AbstractResult):
             return NotImplemented
         return other.error is not None and self.error == other.error
@@ -295,3 +359,26 @@ class Err(AbstractResult[NotsetT, E], Generic[E]):
 # --- Result type hints --- #
 Result = Union[Ok[R], Err[E]]
 NoneOr = Union[Ok[None], Err[E]]
+
+
+# --- Result helpers --- #
+def is_ok(result: Result[R, Any]) -> TypeGuard[Ok[R]]:
+    """
+    Returns
+    -------
+    bool
+        Whether `result` is successful.
+        Only reads the error field, which is cheaper than `isinstance(result, Ok)`.
+    """
+    return result.error is None
+
+
+def is_err(result: Result[Any, E]) -> TypeGuard[Err[E]]:
+    """
+    Returns
+    -------
+    bool
+        Whether `result` contains an error.
+        Only reads the error field, which is cheaper than `isinstance(result, Err)`.
+    """
+    return result.error is not None
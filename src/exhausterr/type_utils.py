@@ -5,8 +5,8 @@ Type definitions for better type annotations.
 @author: Baptiste Pestourie
 """
 
-from typing import Protocol, Iterator
-import itertools
+from typing import Protocol
+from weakref import WeakKeyDictionary
 
 
 class TypedDictDefinition(Protocol):
@@ -22,29 +22,38 @@ class TypedDictDefinition(Protocol):
     __required_keys__: frozenset[str]
 
 
-def order_typed_dict_keys(typed_dict: TypedDictDefinition) -> Iterator[str]:
+# Ordered keys per TypedDict class, see `order_typed_dict_keys`
+_ordered_keys_cache: WeakKeyDictionary[TypedDictDefinition, tuple[str, ...]] = (
+    WeakKeyDictionary()
+)
+
+
+def order_typed_dict_keys(typed_dict: TypedDictDefinition) -> tuple[str, ...]:
     """
     Allows ordering the keys of a typed dict in declaration order,
     as __required_keys__ and __optional_keys__ are not ordered.
 
-    Yields
-    ------
-    str
+    The ordering is computed once per TypedDict class and cached,
+    as TypedDict definitions do not change after creation.
+
+    Returns
+    -------
+    tuple[str, ...]
         Required keys in declaration order, followed by optional keys in declaration order.
         Note that this means that optional keys declared before required one will still
         be put after in this ordering.
     """
-    required_keys = typed_dict.__required_keys__
+    cached = _ordered_keys_cache.get(typed_dict)
+    if cached is not None:
+        return cached
 
-    required_keys_ordered: list[str] = []
-    optional_keys_ordered: list[str] = []
+    required_keys = typed_dict.__required_keys__
 
-    for annotation in typed_dict.__annotations__.keys():
-        container = (
-            required_keys_ordered
-            if annotation in required_keys
-            else optional_keys_ordered
-        )
-        container.append(annotation)
+    # Indexed by "is optional": required keys first, optional keys second
+    buckets: tuple[list[str], list[str]] = ([], [])
+    for annotation in typed_dict.__annotations__:
+        buckets[annotation not in required_keys].append(annotation)
 
-    return itertools.chain(required_keys_ordered, optional_keys_ordered)
\ No newline at end of file
+    ordered = (*buckets[0], *buckets[1])
+    _ordered_keys_cache[typed_dict] = ordered
+    return ordered
\ No newline at end of file
@@ -6,7 +6,9 @@ Test suite for the error wrappers on as alternative to builtin primitives.
 """
 
 from __future__ import annotations
+from collections import defaultdict
 from dataclasses import dataclass
+from typing import Mapping, cast
 import pytest
 from exhausterr import (
     Ok,
@@ -19,6 +21,7 @@ from exhausterr import (
     BadKey,
     BadAttribute,
 )
+from test_results import NoEq
 
 
 @pytest.mark.parametrize("a,b", [(5, 0), (5, 2)])
@@ -72,3 +75,22 @@ def test_safe_getitem() -> None:
             case Err(err):
                 assert attr == "c"
                 assert isinstance(err, BadKey)
+
+
+def test_safe_getattr_default() -> None:
+    """
+    Checks that defaults are returned as-is, without ever being compared
+    against the internal sentinel with `==`.
+    """
+    default = NoEq()
+    assert safe_getattr(object(), "missing", default).unwrap() is default
+    assert safe_getitem({}, "missing", default).unwrap() is default
+
+
+def test_safe_getitem_missing() -> None:
+    """
+    Checks that mappings defining __missing__ keep their semantics.
+    """
+    counts: defaultdict[str, int] = defaultdict(int)
+    assert safe_getitem(cast(Mapping[object, object], counts), "a") == Ok(0)
+    assert "a" in counts
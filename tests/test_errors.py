@@ -63,6 +63,20 @@ def test_order_typed_dict_keys_inherited() -> None:
         assert list(order_typed_dict_keys(_ChildDict)) == ["b", "d", "a", "c"]
 
 
+def test_order_typed_dict_keys_cached() -> None:
+    """
+    Checks that the key ordering is computed once per TypedDict class.
+    """
+
+    class _TypedDictTest(TypedDict):
+        a: NotRequired[str]
+        b: str
+
+    ordered = order_typed_dict_keys(_TypedDictTest)
+    assert ordered == ("b", "a")
+    assert order_typed_dict_keys(_TypedDictTest) is ordered
+
+
 class BasicError(Error):
     """
     A basic error that does not introduce any additional
@@ -196,3 +210,68 @@ def test_error_formatting() -> None:
     """
     err = ErrorWihFormatting(a=1, b=2.0)
     assert str(err) == ("a: 1, b: 2.0")
+
+
+def test_error_args() -> None:
+    """
+    Checks that args only exposes public fields and
+    returns the field values as-is rather than copies.
+    """
+    payload = [1, 2]
+    err = ErrorWithArgs(a=payload, b=2.0)  # type: ignore[arg-type]
+    err.add_notes("a note")
+    assert err.args == {"a": payload, "b": 2.0}
+    assert err.args["a"] is payload
+
+
+def test_error_constant_description() -> None:
+    """
+    Checks that descriptions without format fields are returned as-is,
+    and that escaped braces are still unescaped.
+    """
+
+    class EscapedError(Error):
+        description = "{{not a field}}"
+
+    assert BasicError._format is None
+    assert str(BasicError()) == "A basic error"
+    assert str(EscapedError()) == "{not a field}"
+
+
+def test_error_description_reassigned() -> None:
+    """
+    Checks that reassigning the description after class creation
+    is taken into account when formatting.
+    """
+
+    @dataclass
+    class ReassignedError(Error):
+        description = "constant"
+        x: int
+
+    assert str(ReassignedError(1)) == "constant"
+    ReassignedError.description = "x={x}"
+    assert str(ReassignedError(1)) == "x=1"
+    ReassignedError.description = "now {x}"
+    assert str(ReassignedError(2)) == "now 2"
+    ReassignedError.description = "constant again"
+    assert str(ReassignedError(3)) == "constant again"
+
+
+def test_error_notes_not_shared() -> None:
+    """
+    Checks that notes added to an error do not leak to other instances.
+    """
+    err = BasicError()
+    err.add_notes("note1")
+    err.add_notes("note2")
+    assert err._notes == ("note1", "note2")
+    assert BasicError()._notes == ()
+
+
+def test_error_throw_formatted() -> None:
+    """
+    Checks that the raised exception carries the formatted description.
+    """
+    with pytest.raises(ValueError, match=r"^a: 1, b: 2.0$"):
+        ErrorWithArgs(a=1, b=2.0).throw()
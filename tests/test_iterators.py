@@ -7,7 +7,20 @@ Test suite for Result mapping primitives
 
 from __future__ import annotations
 from functools import partial
-from exhausterr import resultify, result_mapper, Ok, Error, Err, Result, result_reducer, chain_results
+from operator import length_hint
+from exhausterr import (
+    resultify,
+    resultify_list,
+    result_mapper,
+    result_map_reduce,
+    Ok,
+    Error,
+    Err,
+    Result,
+    result_reducer,
+    result_collect,
+    chain_results,
+)
 
 
 class ZeroDivision(Error):
@@ -23,6 +36,15 @@ def test_resultify() -> None:
         assert isinstance(result, Ok)
 
 
+def test_resultify_list() -> None:
+    """
+    Sanity checks for resultify_list().
+    """
+    results = resultify_list(range(100))
+    assert isinstance(results, list)
+    assert results == list(resultify(range(100)))
+
+
 # test primitives
 def invert(value: float) -> Result[float, ZeroDivision]:
     if value == 0:
@@ -36,6 +58,19 @@ def subtract_to_one_and_invert(value: float) -> Result[float, ZeroDivision]:
     return Ok(1 / (1 - value))
 
 
+class TrackedInvert:
+    """
+    `invert`, recording the values it gets called with.
+    """
+
+    def __init__(self) -> None:
+        self.calls: list[float] = []
+
+    def __call__(self, value: float) -> Result[float, ZeroDivision]:
+        self.calls.append(value)
+        return invert(value)
+
+
 def test_result_mapper_single_function() -> None:
     """
     Tests the result mapper with a single map function
@@ -90,6 +125,18 @@ def test_result_reducer_err_case_case() -> None:
         reducer=lambda a,b: a + b,
     ) ==  Err()
 
+def test_result_collect() -> None:
+    """
+    Tests the result collector
+    """
+    initial = [1]
+    assert result_collect(Ok(2), Ok(3), Ok(5), into=initial) == Ok([1, 2, 3, 5])
+    assert initial == [1]
+    assert result_collect(Ok(2), Ok(3)) == Ok([2, 3])
+
+    failure: Err[ZeroDivision] = Err(ZeroDivision())
+    assert result_collect(Ok(2), failure, Ok(5)) is failure
+
 def test_result_chain_ok_case() -> None:
     """
     Tests the result reducer
@@ -135,4 +182,109 @@ def test_result_chain_err_case() -> None:
         panic,
         initializer=0,
         reducer=lambda a,b: a + b,
-    ) ==  Err()
\ No newline at end of file
+    ) ==  Err()
+
+def test_result_mapper_yields_original_err() -> None:
+    """
+    Checks that the Err returned by a failing function is yielded as-is
+    """
+    failure: Err[ZeroDivision] = Err(ZeroDivision())
+    (mapped,) = result_mapper([0], lambda _: failure, invert)
+    assert mapped is failure
+
+
+def test_result_mapper_no_function() -> None:
+    """
+    Checks that mapping without any function wraps values in Ok
+    """
+    assert list(result_mapper(range(3))) == [Ok(0), Ok(1), Ok(2)]
+
+
+def test_result_reducer_without_reducer() -> None:
+    """
+    Checks that the result reducer only checks for errors
+    when no reducer is given, and returns the first Err as-is.
+    """
+    assert result_reducer(Ok(2), Ok(3)) == Ok()
+    failure: Err[ZeroDivision] = Err(ZeroDivision())
+    assert result_reducer(Ok(2), failure, Err()) is failure
+    assert chain_results(lambda: Ok(2), lambda: failure) is failure
+
+
+def test_result_mapper_length_hint() -> None:
+    """
+    Checks that the result mapper forwards the length of the mapped collection
+    """
+    mapped = result_mapper(range(5), invert)
+    assert length_hint(mapped) == 5
+    next(iter(mapped))
+    assert length_hint(mapped) == 4
+
+
+def test_result_mapper_stop_on_error() -> None:
+    """
+    Checks that the result mapper stops after the first error when requested
+    """
+    tracked_invert = TrackedInvert()
+
+    mapped = list(result_mapper([1, 0, 2], tracked_invert, stop_on_error=True))
+    assert mapped[0] == Ok(1.0)
+    assert type(mapped[1].error) is ZeroDivision
+    assert len(mapped) == 2
+    assert tracked_invert.calls == [1, 0]
+
+
+def test_result_mapper_memoize() -> None:
+    """
+    Checks that memoized mapping calls each function once per distinct value
+    """
+    tracked_invert = TrackedInvert()
+
+    values = [2, 0, 2, 4, 0]
+    mapped = list(result_mapper(values, tracked_invert, memoize=True))
+    assert mapped == list(result_mapper(values, invert))
+    assert tracked_invert.calls == [2, 0, 4]
+
+    # equal values of different types are not merged
+    type_names = result_mapper(
+        [1, True, 1.0], lambda value: Ok(type(value).__name__), memoize=True
+    )
+    assert [r.unwrap() for r in type_names] == ["int", "bool", "float"]
+
+    # unhashable intermediate values are mapped uncached
+    lengths = result_mapper(
+        [1, 2, 1],
+        lambda value: Ok([value] * value),
+        lambda values: Ok(len(values)),
+        memoize=True,
+    )
+    assert [r.unwrap() for r in lengths] == [1, 2, 1]
+
+
+def test_result_map_reduce() -> None:
+    """
+    Tests the fused mapper/reducer against the separate primitives
+    """
+    values = [1, 2, 4]
+    expected = result_reducer(
+        *result_mapper(values, invert, subtract_to_one_and_invert),
+        initializer=0.0,
+        reducer=lambda a, b: a + b,
+    )
+    assert result_map_reduce(
+        values,
+        invert,
+        subtract_to_one_and_invert,
+        initializer=0.0,
+        reducer=lambda a, b: a + b,
+    ) == expected
+    assert result_map_reduce(values, initializer=0, reducer=lambda a, b: a + b) == Ok(7)
+
+    # errors stop the reduction, later values are never mapped
+    tracked_invert = TrackedInvert()
+
+    mapped = result_map_reduce(
+        [2, 0, 4], tracked_invert, initializer=0.0, reducer=lambda a, b: a + b
+    )
+    assert type(mapped.error) is ZeroDivision
+    assert tracked_invert.calls == [2, 0]
@@ -5,13 +5,27 @@ Test suite for results objects.
 @author: Baptiste Pestourie
 """
 
-from typing import assert_never
+import copy
+import pickle
+import weakref
+from typing import Any, assert_never
 
 import pytest
-from exhausterr import AbstractResult, Result, Ok, Err
+from exhausterr import AbstractResult, Result, Ok, Err, is_ok, is_err
 from test_errors import BasicError
 
 
+class NoEq:
+    """
+    A value that fails any test comparing it with `==`.
+    """
+
+    def __eq__(self, other: object) -> bool:
+        raise AssertionError("__eq__ should not be called")
+
+    __hash__ = object.__hash__
+
+
 def fails_on_true(should_fail: bool) -> Result[bool, BasicError]:
     if should_fail:
         return Err(BasicError)
@@ -77,3 +91,109 @@ def test_result_unwrap() -> None:
         fails.unwrap()
 
     assert fails_on_true(False).unwrap() is True
+
+
+def test_result_slots() -> None:
+    """
+    Checks that results do not carry a per-instance __dict__.
+    """
+    assert not hasattr(Ok(True), "__dict__")
+    assert not hasattr(Err(BasicError), "__dict__")
+    result = Ok(3)
+    assert weakref.ref(result)() is result
+
+
+def test_result_copy_and_pickle() -> None:
+    """
+    Checks that results survive copies and pickling round-trips,
+    and that copying does not alter the shared `Ok()` instance.
+    """
+    results: list[Result[Any, BasicError]] = [
+        Ok(5),
+        Ok("x"),
+        Ok(),
+        Err(BasicError()),
+    ]
+    for result in results:
+        assert copy.copy(result) == result
+        assert copy.deepcopy(result) == result
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            assert pickle.loads(pickle.dumps(result, protocol)) == result
+    assert copy.copy(Ok(5)) is not Ok()
+    assert Ok().value is None
+
+
+class Tagged(AbstractResult[int, None]):
+    """
+    A custom result carrying extra per-instance state.
+    """
+
+    def __init__(self, value: int, tag: str) -> None:
+        super().__init__(value, None)
+        self.tag = tag
+
+
+class Timed(AbstractResult[int, None]):
+    """
+    A custom slotted result with a different constructor signature.
+    """
+
+    __slots__ = ("ts",)
+
+    def __init__(self, value: int, ts: float) -> None:
+        super().__init__(value, None)
+        self.ts = ts
+
+
+def test_custom_result_copy_and_pickle() -> None:
+    """
+    Checks that copying or pickling custom results preserves their whole state.
+    """
+    tagged = Tagged(1, "custom")
+    timed = Timed(2, 3.5)
+    for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+        tagged_copy = pickle.loads(pickle.dumps(tagged, protocol))
+        timed_copy = pickle.loads(pickle.dumps(timed, protocol))
+        assert (tagged_copy.value, tagged_copy.tag) == (1, "custom")
+        assert (timed_copy.value, timed_copy.ts) == (2, 3.5)
+    for copier in (copy.copy, copy.deepcopy):
+        assert copier(tagged).tag == "custom"
+        assert copier(timed).ts == 3.5
+        assert copier(timed).error is None
+
+
+def test_ok_constants_are_shared() -> None:
+    """
+    Checks that `Ok()`, `Ok(None)` and boolean results return shared instances,
+    while other values still get their own result.
+    """
+    assert Ok() is Ok(None)
+    assert Ok().value is None
+    assert Ok(True) is Ok(True)
+    assert Ok(False).value is False
+    assert Ok(0) is not Ok(0)
+    assert Ok(0) is not Ok(False)
+    # copies of other values must not land on the shared instances
+    assert copy.copy(Ok(5)).value == 5
+    assert copy.copy(Ok(1)).value == 1
+    assert Ok(True).value is True
+    assert copy.copy(Ok(True)) is Ok(True)
+
+
+def test_result_unwrap_does_not_compare_value() -> None:
+    """
+    Checks that unwrap() does not rely on the wrapped value's __eq__.
+    """
+    value = NoEq()
+    assert AbstractResult(value, None).unwrap() is value
+
+
+@pytest.mark.parametrize("successful", [True, False])
+def test_is_ok_is_err(successful: bool) -> None:
+    """
+    Checks that is_ok() and is_err() agree with the result type.
+    """
+    result = fails_on_true(not successful)
+    assert is_ok(result) is successful
+    assert is_err(result) is not successful
+    assert is_ok(result) is isinstance(result, Ok)